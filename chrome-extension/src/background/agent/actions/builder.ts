@@ -42,27 +42,29 @@ export class InvalidInputError extends Error {
  * An action is a function that takes an input and returns an ActionResult
  */
 export class Action {
+  // Whether the schema is z.object({}), the schema never changes so this is computed once
+  private readonly isEmptySchema: boolean;
+
   constructor(
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
     private readonly handler: (input: any) => Promise<ActionResult>,
     public readonly schema: ActionSchema,
     // Whether this action has an index argument
     public readonly hasIndex: boolean = false,
-  ) {}
+  ) {
+    const zodSchema = this.schema.schema;
+    this.isEmptySchema =
+      zodSchema instanceof z.ZodObject &&
+      Object.keys((zodSchema as z.ZodObject<Record<string, z.ZodTypeAny>>).shape || {}).length === 0;
+  }
 
   async call(input: unknown): Promise<ActionResult> {
-    // Validate input before calling the handler
-    const schema = this.schema.schema;
-
-    // check if the schema is schema: z.object({}), if so, ignore the input
-    const isEmptySchema =
-      schema instanceof z.ZodObject &&
-      Object.keys((schema as z.ZodObject<Record<string, z.ZodTypeAny>>).shape || {}).length === 0;
-
-    if (isEmptySchema) {
+    // if the schema is empty, ignore the input
+    if (this.isEmptySchema) {
       return await this.handler({});
     }
 
+    // Validate input before calling the handler
     const parsedArgs = this.schema.schema.safeParse(input);
     if (!parsedArgs.success) {
       const errorMessage = parsedArgs.error.message;
@@ -282,7 +284,8 @@ export class ActionBuilder {
         this.context.emitEvent(Actors.NAVIGATOR, ExecutionState.ACT_START, intent);
 
         const page = await this.context.browserContext.getCurrentPage();
-        const state = await page.getState();
+        // the navigator refreshes the state right before every index action, only rebuild the DOM tree if there is none
+        const state = page.getCachedState() ?? (await page.getState());
 
         const elementNode = state?.selectorMap.get(input.index);
         if (!elementNode) {
@@ -3,6 +3,7 @@ import type { BaseChatModel } from '@langchain/core/language_models/chat_models'
 import type { AgentContext, AgentOutput } from '../types';
 import type { BasePrompt } from '../prompts/base';
 import type { BaseMessage } from '@langchain/core/messages';
+import type { Runnable } from '@langchain/core/runnables';
 import { createLogger } from '@src/background/log';
 import type { Action } from '../actions/builder';
 import { convertInputMessages, extractJsonFromModelOutput, removeThinkTags } from '../messages/utils';
@@ -14,6 +15,9 @@ const logger = createLogger('agent');
 // eslint-disable-next-line @typescript-eslint/no-explicit-any
 export type CallOptions = Record<string, any>;
 
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+type StructuredOutputRunnable = Runnable<BaseMessage[], { raw: BaseMessage; parsed: any }>;
+
 // Update options to use Zod schema
 export interface BaseAgentOptions {
   chatLLM: BaseChatModel;
@@ -46,6 +50,7 @@ export abstract class BaseAgent<T extends z.ZodType, M = unknown> {
   protected withStructuredOutput: boolean;
   protected callOptions?: CallOptions;
   protected modelOutputToolName: string;
+  private structuredLlm?: StructuredOutputRunnable;
   declare ModelOutput: z.infer<T>;
 
   constructor(modelOutputSchema: T, options: BaseAgentOptions, extraOptions?: Partial<ExtraAgentOptions>) {
@@ -127,10 +132,7 @@ export abstract class BaseAgent<T extends z.ZodType, M = unknown> {
         modelProvider: this.provider,
       });
 
-      const structuredLlm = this.chatLLM.withStructuredOutput(this.modelOutputSchema, {
-        includeRaw: true,
-        name: this.modelOutputToolName,
-      });
+      const structuredLlm = this.getStructuredLlm();
 
       let response = undefined;
       try {
@@ -140,11 +142,14 @@ export abstract class BaseAgent<T extends z.ZodType, M = unknown> {
           ...this.callOptions,
         });
 
-        logger.debug(`[${this.modelName}] LLM response received:`, {
-          hasParsed: !!response.parsed,
-          hasRaw: !!response.raw,
-          rawContent: response.raw?.content?.slice(0, 500) + (response.raw?.content?.length > 500 ? '...' : ''),
-        });
+        // the summary below slices the raw content, only build it when debug logs are enabled
+        if (import.meta.env.DEV) {
+          logger.debug(`[${this.modelName}] LLM response received:`, {
+            hasParsed: !!response.parsed,
+            hasRaw: !!response.raw,
+            rawContent: response.raw?.content?.slice(0, 500) + (response.raw?.content?.length > 500 ? '...' : ''),
+          });
+        }
 
         if (response.parsed) {
           logger.debug(`[${this.modelName}] Successfully parsed structured output`);
@@ -199,6 +204,22 @@ export abstract class BaseAgent<T extends z.ZodType, M = unknown> {
     throw new ResponseParseError('Could not parse response');
   }
 
+  // Schema passed to withStructuredOutput, subclasses can override it with a pre-converted json schema
+  protected getStructuredOutputSchema(): z.ZodType | Record<string, unknown> {
+    return this.modelOutputSchema;
+  }
+
+  // Build the structured output runnable once and reuse it for every step
+  protected getStructuredLlm(): StructuredOutputRunnable {
+    if (!this.structuredLlm) {
+      this.structuredLlm = this.chatLLM.withStructuredOutput(this.getStructuredOutputSchema(), {
+        includeRaw: true,
+        name: this.modelOutputToolName,
+      });
+    }
+    return this.structuredLlm;
+  }
+
   // Execute the agent and return the result
   abstract execute(): Promise<AgentOutput<M>>;
 
@@ -30,6 +30,7 @@ import { AgentStepRecord } from '../history';
 import { type DOMHistoryElement } from '@src/background/browser/dom/history/view';
 
 const logger = createLogger('NavigatorAgent');
+const replayLogger = createLogger('NavigatorAgent:executeHistoryStep');
 
 interface ParsedModelOutput {
   current_state?: {
@@ -39,7 +40,8 @@ interface ParsedModelOutput {
 }
 
 export class NavigatorActionRegistry {
-  private actions: Record<string, Action> = {};
+  // a Map keeps lookups of model-provided action names away from Object.prototype keys
+  private actions = new Map<string, Action>();
 
   constructor(actions: Action[]) {
     for (const action of actions) {
@@ -48,19 +50,19 @@ export class NavigatorActionRegistry {
   }
 
   registerAction(action: Action): void {
-    this.actions[action.name()] = action;
+    this.actions.set(action.name(), action);
   }
 
   unregisterAction(name: string): void {
-    delete this.actions[name];
+    this.actions.delete(name);
   }
 
   getAction(name: string): Action | undefined {
-    return this.actions[name];
+    return this.actions.get(name);
   }
 
   setupModelOutputSchema(): z.ZodType {
-    const actionSchema = buildDynamicActionSchema(Object.values(this.actions));
+    const actionSchema = buildDynamicActionSchema(Array.from(this.actions.values()));
     return z.object({
       current_state: agentBrainSchema,
       action: z.array(actionSchema),
@@ -90,13 +92,14 @@ export class NavigatorAgent extends BaseAgent<z.ZodType, NavigatorResult> {
     this.jsonSchema = convertZodToJsonSchema(this.modelOutputSchema, 'NavigatorAgentOutput', true);
   }
 
+  protected getStructuredOutputSchema(): Record<string, unknown> {
+    return this.jsonSchema;
+  }
+
   async invoke(inputMessages: BaseMessage[]): Promise<this['ModelOutput']> {
     // Use structured output
     if (this.withStructuredOutput) {
-      const structuredLlm = this.chatLLM.withStructuredOutput(this.jsonSchema, {
-        includeRaw: true,
-        name: this.modelOutputToolName,
-      });
+      const structuredLlm = this.getStructuredLlm();
 
       let response = undefined;
       try {
@@ -249,19 +252,9 @@ export class NavigatorAgent extends BaseAgent<z.ZodType, NavigatorResult> {
         this.context.emitEvent(Actors.NAVIGATOR, ExecutionState.STEP_CANCEL, 'Navigation cancelled');
       }
       if (browserStateHistory) {
-        // Create a copy of actionResults to store in history
-        const actionResultsCopy = actionResults.map(result => {
-          return new ActionResult({
-            isDone: result.isDone,
-            success: result.success,
-            extractedContent: result.extractedContent,
-            error: result.error,
-            includeInMemory: result.includeInMemory,
-            interactedElement: result.interactedElement,
-          });
-        });
-
-        const history = new AgentStepRecord(modelOutputString, actionResultsCopy, browserStateHistory);
+        // The results themselves are never mutated after an action completes, only the slots of
+        // context.actionResults are replaced, so a shallow copy of the array is enough for history
+        const history = new AgentStepRecord(modelOutputString, [...actionResults], browserStateHistory);
         this.context.history.history.push(history);
 
         // logger.info('All history', JSON.stringify(this.context.history, null, 2));
@@ -309,6 +302,9 @@ export class NavigatorAgent extends BaseAgent<z.ZodType, NavigatorResult> {
 
     const state = await this.prompt.getUserMessage(this.context);
     messageManager.addStateMessage(state);
+    // keep the prompt within maxInputTokens: drops old history first, then the screenshot,
+    // and throws when the state message alone does not fit
+    messageManager.cutMessages();
     this.context.stateMessageAdded = true;
   }
 
@@ -369,7 +365,9 @@ export class NavigatorAgent extends BaseAgent<z.ZodType, NavigatorResult> {
     logger.info('Actions', actions);
 
     const browserContext = this.context.browserContext;
-    const browserState = await browserContext.getState(this.context.options.useVision);
+    // these states are only used for the selector map and element hashes, the model already got the
+    // screenshot with the state message, so never capture one here
+    const browserState = await browserContext.getState(false);
     const cachedPathHashes = await calcBranchPathHashSet(browserState);
 
     await browserContext.removeHighlight();
@@ -390,7 +388,7 @@ export class NavigatorAgent extends BaseAgent<z.ZodType, NavigatorResult> {
 
         const indexArg = actionInstance.getIndexArg(actionArgs);
         if (i > 0 && indexArg !== null) {
-          const newState = await browserContext.getState(this.context.options.useVision);
+          const newState = await browserContext.getState(false);
           const newPathHashes = await calcBranchPathHashSet(newState);
           // next action requires index but there are new elements on the page
           if (!newPathHashes.isSubsetOf(cachedPathHashes)) {
@@ -427,8 +425,11 @@ export class NavigatorAgent extends BaseAgent<z.ZodType, NavigatorResult> {
         if (this.context.paused || this.context.stopped) {
           return results;
         }
-        // TODO: wait for 1 second for now, need to optimize this to avoid unnecessary waiting
-        await new Promise(resolve => setTimeout(resolve, 1000));
+        // The next state fetch already waits for the page and its network requests to settle,
+        // so only pause briefly between actions of the same step and not after the last one
+        if (i < actions.length - 1) {
+          await new Promise(resolve => setTimeout(resolve, browserContext.getConfig().waitBetweenActions * 1000));
+        }
       } catch (error) {
         if (error instanceof URLNotAllowedError) {
           throw error;
@@ -556,7 +557,6 @@ export class NavigatorAgent extends BaseAgent<z.ZodType, NavigatorResult> {
     delay = 1000,
     skipFailures = true,
   ): Promise<ActionResult[]> {
-    const replayLogger = createLogger('NavigatorAgent:executeHistoryStep');
     const results: ActionResult[] = [];
 
     // Parse and validate model output
@@ -4,49 +4,58 @@ import { createLogger } from '../../log';
 const logger = createLogger('event-manager');
 
 export class EventManager {
-  private _subscribers: Map<EventType, EventCallback[]>;
+  private _subscribers: Map<EventType, Set<EventCallback>>;
 
   constructor() {
     this._subscribers = new Map();
   }
 
   subscribe(eventType: EventType, callback: EventCallback): void {
-    if (!this._subscribers.has(eventType)) {
-      this._subscribers.set(eventType, []);
-    }
-
-    const callbacks = this._subscribers.get(eventType);
-    if (callbacks && !callbacks.includes(callback)) {
-      callbacks.push(callback);
+    let callbacks = this._subscribers.get(eventType);
+    if (!callbacks) {
+      callbacks = new Set();
+      this._subscribers.set(eventType, callbacks);
     }
+    // a Set keeps subscription order and ignores duplicates
+    callbacks.add(callback);
   }
 
   unsubscribe(eventType: EventType, callback: EventCallback): void {
-    if (this._subscribers.has(eventType)) {
-      const callbacks = this._subscribers.get(eventType);
-      if (callbacks) {
-        this._subscribers.set(
-          eventType,
-          callbacks.filter(cb => cb !== callback),
-        );
-      }
-    }
+    this._subscribers.get(eventType)?.delete(callback);
   }
 
   clearSubscribers(eventType: EventType): void {
     if (this._subscribers.has(eventType)) {
-      this._subscribers.set(eventType, []);
+      this._subscribers.set(eventType, new Set());
     }
   }
 
+  hasSubscribers(eventType: EventType): boolean {
+    return (this._subscribers.get(eventType)?.size ?? 0) > 0;
+  }
+
   async emit(event: AgentEvent): Promise<void> {
     const callbacks = this._subscribers.get(event.type);
-    if (callbacks) {
-      try {
-        await Promise.all(callbacks.map(async callback => await callback(event)));
-      } catch (error) {
-        logger.error('Error executing event callbacks:', error);
-      }
+    if (!callbacks || callbacks.size === 0) {
+      return;
+    }
+
+    // most executors have a single subscriber (the side panel port), skip the Promise.all fan-out for it
+    if (callbacks.size === 1) {
+      const [callback] = callbacks;
+      await this._invokeCallback(callback, event);
+    } else {
+      // copy the Set first, so callbacks that subscribe or unsubscribe do not affect this emit
+      await Promise.all([...callbacks].map(callback => this._invokeCallback(callback, event)));
+    }
+  }
+
+  // Errors are caught per callback, so a failing subscriber (sync throw or rejection) cannot silence the others
+  private async _invokeCallback(callback: EventCallback, event: AgentEvent): Promise<void> {
+    try {
+      await callback(event);
+    } catch (error) {
+      logger.error('Error executing event callback:', error);
     }
   }
 }
@@ -1,12 +1,12 @@
 import type { BaseChatModel } from '@langchain/core/language_models/chat_models';
-import { type ActionResult, AgentContext, type AgentOptions, type AgentOutput } from './types';
+import { type ActionResult, AgentContext, type AgentOptions, type AgentOutput, AgentStepInfo } from './types';
 import { t } from '@extension/i18n';
 import { NavigatorAgent, NavigatorActionRegistry } from './agents/navigator';
 import { PlannerAgent, type PlannerOutput } from './agents/planner';
 import { NavigatorPrompt } from './prompts/navigator';
 import { PlannerPrompt } from './prompts/planner';
 import { createLogger } from '@src/background/log';
-import MessageManager from './messages/service';
+import MessageManager, { MessageManagerSettings } from './messages/service';
 import type BrowserContext from '../browser/context';
 import { ActionBuilder } from './actions/builder';
 import { EventManager } from './event/manager';
@@ -27,6 +27,7 @@ import type { GeneralSettingsConfig } from '@extension/storage';
 import { analytics } from '../services/analytics';
 
 const logger = createLogger('Executor');
+const replayLogger = createLogger('Executor:replayHistory');
 
 export interface ExecutorExtraArgs {
   plannerLLM?: BaseChatModel;
@@ -50,7 +51,9 @@ export class Executor {
     navigatorLLM: BaseChatModel,
     extraArgs?: Partial<ExecutorExtraArgs>,
   ) {
-    const messageManager = new MessageManager();
+    const messageManager = new MessageManager(
+      new MessageManagerSettings({ maxInputTokens: extraArgs?.agentOptions?.maxInputTokens }),
+    );
 
     const plannerLLM = extraArgs?.plannerLLM ?? navigatorLLM;
     const extractorLLM = extraArgs?.extractorLLM ?? navigatorLLM;
@@ -130,23 +133,25 @@ export class Executor {
     // reset the step counter
     const context = this.context;
     context.nSteps = 0;
-    const allowedMaxSteps = this.context.options.maxSteps;
+    const allowedMaxSteps = context.options.maxSteps;
+    const planningInterval = context.options.planningInterval;
 
     try {
-      this.context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_START, this.context.taskId);
+      context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_START, context.taskId);
 
       // Track task start
-      void analytics.trackTaskStart(this.context.taskId);
+      void analytics.trackTaskStart(context.taskId);
 
       let step = 0;
       let latestPlanOutput: AgentOutput<PlannerOutput> | null = null;
       let navigatorDone = false;
 
+      // a single step info is shared for the whole run, only the step number changes per step
+      const stepInfo = new AgentStepInfo({ stepNumber: context.nSteps, maxSteps: allowedMaxSteps });
+      context.stepInfo = stepInfo;
+
       for (step = 0; step < allowedMaxSteps; step++) {
-        context.stepInfo = {
-          stepNumber: context.nSteps,
-          maxSteps: context.options.maxSteps,
-        };
+        stepInfo.stepNumber = context.nSteps;
 
         logger.info(`🔄 Step ${step + 1} / ${allowedMaxSteps}`);
         if (await this.shouldStop()) {
@@ -154,7 +159,7 @@ export class Executor {
         }
 
         // Run planner periodically for guidance
-        if (this.planner && (context.nSteps % context.options.planningInterval === 0 || navigatorDone)) {
+        if (this.planner && (context.nSteps % planningInterval === 0 || navigatorDone)) {
           navigatorDone = false;
           latestPlanOutput = await this.runPlanner();
 
@@ -178,51 +183,54 @@ export class Executor {
 
       if (isCompleted) {
         // Emit final answer if available, otherwise use task ID
-        const finalMessage = this.context.finalAnswer || this.context.taskId;
-        this.context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_OK, finalMessage);
+        const finalMessage = context.finalAnswer || context.taskId;
+        context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_OK, finalMessage);
 
         // Track task completion
-        void analytics.trackTaskComplete(this.context.taskId);
+        void analytics.trackTaskComplete(context.taskId);
       } else if (step >= allowedMaxSteps) {
         logger.error('❌ Task failed: Max steps reached');
-        this.context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_FAIL, t('exec_errors_maxStepsReached'));
+        context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_FAIL, t('exec_errors_maxStepsReached'));
 
         // Track task failure with specific error category
         const maxStepsError = new MaxStepsReachedError(t('exec_errors_maxStepsReached'));
         const errorCategory = analytics.categorizeError(maxStepsError);
-        void analytics.trackTaskFailed(this.context.taskId, errorCategory);
-      } else if (this.context.stopped) {
-        this.context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_CANCEL, t('exec_task_cancel'));
+        void analytics.trackTaskFailed(context.taskId, errorCategory);
+      } else if (context.stopped) {
+        context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_CANCEL, t('exec_task_cancel'));
 
         // Track task cancellation
-        void analytics.trackTaskCancelled(this.context.taskId);
+        void analytics.trackTaskCancelled(context.taskId);
       } else {
-        this.context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_PAUSE, t('exec_task_pause'));
+        context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_PAUSE, t('exec_task_pause'));
         // Note: We don't track pause as it's not a final state
       }
     } catch (error) {
       if (error instanceof RequestCancelledError) {
-        this.context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_CANCEL, t('exec_task_cancel'));
+        context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_CANCEL, t('exec_task_cancel'));
 
         // Track task cancellation
-        void analytics.trackTaskCancelled(this.context.taskId);
+        void analytics.trackTaskCancelled(context.taskId);
       } else {
         const errorMessage = error instanceof Error ? error.message : String(error);
-        this.context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_FAIL, t('exec_task_fail', [errorMessage]));
+        context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_FAIL, t('exec_task_fail', [errorMessage]));
 
         // Track task failure with detailed error categorization
         const errorCategory = analytics.categorizeError(error instanceof Error ? error : errorMessage);
-        void analytics.trackTaskFailed(this.context.taskId, errorCategory);
+        void analytics.trackTaskFailed(context.taskId, errorCategory);
       }
     } finally {
       if (import.meta.env.DEV) {
-        logger.debug('Executor history', JSON.stringify(this.context.history, null, 2));
+        logger.debug('Executor history', JSON.stringify(context.history, null, 2));
       }
       // store the history only if replay is enabled
       if (this.generalSettings?.replayHistoricalTasks) {
-        const historyString = JSON.stringify(this.context.history);
+        const historyString = JSON.stringify(context.history);
         logger.info(`Executor history size: ${historyString.length}`);
-        await chatHistoryStore.storeAgentStepHistory(this.context.taskId, this.tasks[0], historyString);
+        // the task outcome has already been emitted, persist the history without holding up execute()
+        chatHistoryStore
+          .storeAgentStepHistory(context.taskId, this.tasks[0], historyString)
+          .catch(error => logger.error('Failed to store agent step history', error));
       } else {
         logger.info('Replay historical tasks is disabled, skipping history storage');
       }
@@ -374,7 +382,6 @@ export class Executor {
     delayBetweenActions = 2.0,
   ): Promise<ActionResult[]> {
     const results: ActionResult[] = [];
-    const replayLogger = createLogger('Executor:replayHistory');
 
     logger.info('replay task', this.tasks[0]);
 
@@ -388,7 +395,9 @@ export class Executor {
       if (history.history.length === 0) {
         throw new Error(t('exec_replay_historyEmpty'));
       }
-      logger.debug(`🔄 Replaying history: ${JSON.stringify(history, null, 2)}`);
+      if (import.meta.env.DEV) {
+        logger.debug(`🔄 Replaying history: ${JSON.stringify(history, null, 2)}`);
+      }
       this.context.emitEvent(Actors.SYSTEM, ExecutionState.TASK_START, this.context.taskId);
 
       for (let i = 0; i < history.history.length; i++) {
@@ -0,0 +1,54 @@
+import { describe, it, expect } from 'vitest';
+import { HumanMessage, SystemMessage } from '@langchain/core/messages';
+import MessageManager, { MessageManagerSettings } from '../service';
+
+function stateMessage(text: string): HumanMessage {
+  return new HumanMessage({
+    content: [
+      { type: 'text', text },
+      { type: 'image_url', image_url: { url: 'data:image/jpeg;base64,AAAA' } },
+    ],
+  });
+}
+
+// one character per token keeps the budgets in these tests easy to follow
+function createManager(maxInputTokens: number): MessageManager {
+  return new MessageManager(
+    new MessageManagerSettings({ maxInputTokens, estimatedCharactersPerToken: 1, imageTokens: 100 }),
+  );
+}
+
+describe('MessageManager.cutMessages', () => {
+  it('drops old history before touching the state message', () => {
+    const manager = createManager(130);
+    manager.addMessageWithTokens(new SystemMessage('s'.repeat(10)), 'init');
+    manager.addMessageWithTokens(new HumanMessage('h'.repeat(50)));
+    manager.addStateMessage(stateMessage('x'.repeat(20)));
+
+    manager.cutMessages();
+
+    const messages = manager.getMessages();
+    expect(messages).toHaveLength(2);
+    expect(Array.isArray(messages[1].content)).toBe(true);
+  });
+
+  it('removes the screenshot from the state message when history alone is not enough', () => {
+    const manager = createManager(50);
+    manager.addMessageWithTokens(new SystemMessage('s'.repeat(10)), 'init');
+    manager.addStateMessage(stateMessage('x'.repeat(20)));
+
+    manager.cutMessages();
+
+    const messages = manager.getMessages();
+    expect(messages).toHaveLength(2);
+    expect(messages[1].content).toBe('x'.repeat(20));
+  });
+
+  it('throws when the state message would have to be removed entirely', () => {
+    const manager = createManager(5);
+    manager.addMessageWithTokens(new SystemMessage('s'.repeat(10)), 'init');
+    manager.addStateMessage(stateMessage('x'.repeat(20)));
+
+    expect(() => manager.cutMessages()).toThrow('Max token limit reached');
+  });
+});
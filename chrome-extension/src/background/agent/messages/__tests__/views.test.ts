@@ -0,0 +1,68 @@
+import { describe, it, expect } from 'vitest';
+import { AIMessage, HumanMessage, SystemMessage, ToolMessage, type BaseMessage } from '@langchain/core/messages';
+import { MessageHistory, MessageMetadata } from '../views';
+
+function buildHistory(entries: Array<[BaseMessage, string | null]>): MessageHistory {
+  const history = new MessageHistory();
+  for (const [message, type] of entries) {
+    history.addMessage(message, new MessageMetadata(10, type));
+  }
+  return history;
+}
+
+function toolCall(id: string): AIMessage {
+  return new AIMessage({
+    content: '',
+    tool_calls: [{ name: 'AgentOutput', args: {}, id, type: 'tool_call' }],
+  });
+}
+
+describe('MessageHistory.removeOldestHistoryMessage', () => {
+  it('removes a tool call together with its tool responses', () => {
+    const history = buildHistory([
+      [new SystemMessage('system'), 'init'],
+      [toolCall('1'), null],
+      [new ToolMessage({ content: 'ok', tool_call_id: '1' }), null],
+      [new ToolMessage({ content: 'ok', tool_call_id: '1' }), null],
+      [new HumanMessage('state'), null],
+    ]);
+
+    expect(history.removeOldestHistoryMessage(['init', 'task'])).toBe(true);
+    expect(history.messages.map(m => m.message.content)).toEqual(['system', 'state']);
+    expect(history.totalTokens).toBe(20);
+  });
+
+  it('keeps protected types and the last message', () => {
+    const history = buildHistory([
+      [new SystemMessage('system'), 'init'],
+      [new HumanMessage('[Your task history memory starts here]'), 'init'],
+      [new HumanMessage('old result'), null],
+      [new HumanMessage('follow-up task'), 'task'],
+      [new HumanMessage('state'), null],
+    ]);
+
+    expect(history.removeOldestHistoryMessage(['init', 'task'])).toBe(true);
+    expect(history.messages.map(m => m.message.content)).toEqual([
+      'system',
+      '[Your task history memory starts here]',
+      'follow-up task',
+      'state',
+    ]);
+  });
+
+  it('returns false when nothing removable is left', () => {
+    const history = buildHistory([
+      [new SystemMessage('system'), 'init'],
+      [new HumanMessage('task'), 'task'],
+      [new HumanMessage('state'), null],
+    ]);
+
+    let removed = 0;
+    while (history.removeOldestHistoryMessage(['init', 'task'])) {
+      removed++;
+    }
+    expect(removed).toBe(0);
+    expect(history.messages).toHaveLength(3);
+    expect(history.totalTokens).toBe(30);
+  });
+});
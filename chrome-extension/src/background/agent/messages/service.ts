@@ -121,7 +121,8 @@ export default class MessageManager {
     const historyStartMessage = new HumanMessage({
       content: '[Your task history memory starts here]',
     });
-    this.addMessageWithTokens(historyStartMessage);
+    // tagged as init so cutMessages never drops the separator between setup and history
+    this.addMessageWithTokens(historyStartMessage, 'init');
 
     // Add available file paths if provided
     if (this.settings.availableFilePaths && this.settings.availableFilePaths.length > 0) {
@@ -188,7 +189,7 @@ export default class MessageManager {
     }
 
     const msg = new HumanMessage({ content: finalContent });
-    this.addMessageWithTokens(msg);
+    this.addMessageWithTokens(msg, 'task');
   }
 
   /**
@@ -246,30 +247,23 @@ export default class MessageManager {
   }
 
   public getMessages(): BaseMessage[] {
-    const messages = this.history.messages
-      .filter(m => {
-        if (!m.message) {
-          console.error(`[MessageManager] Filtering out message with undefined message property:`, m);
-          return false;
-        }
-        return true;
-      })
-      .map(m => m.message);
-
-    let totalInputTokens = 0;
-    logger.debug(`Messages in history: ${this.history.messages.length}:`);
-
+    const messages: BaseMessage[] = [];
     for (const m of this.history.messages) {
-      totalInputTokens += m.metadata.tokens;
-      if (m.message) {
-        logger.debug(`${m.message.constructor.name} - Token count: ${m.metadata.tokens}`);
-      } else {
-        console.error(`[MessageManager] Found message with undefined message property:`, m);
-        logger.debug(`Message with undefined message property - Token count: ${m.metadata.tokens}`);
+      if (!m.message) {
+        console.error(`[MessageManager] Filtering out message with undefined message property:`, m);
+        continue;
       }
+      messages.push(m.message);
     }
 
-    logger.debug(`Total input tokens: ${totalInputTokens}`);
+    // the history keeps a running token total, the per-message breakdown is only useful while developing
+    if (import.meta.env.DEV) {
+      logger.debug(`Messages in history: ${this.history.messages.length}:`);
+      for (const m of this.history.messages) {
+        logger.debug(`${m.message?.constructor.name} - Token count: ${m.metadata.tokens}`);
+      }
+      logger.debug(`Total input tokens: ${this.history.totalTokens}`);
+    }
     return messages;
   }
 
@@ -363,11 +357,21 @@ export default class MessageManager {
   }
 
   /**
-   * Cuts the last message if the total tokens exceed the max input tokens
+   * Keeps the history within the max input tokens
    *
-   * Get current message list, potentially trimmed to max tokens
+   * The oldest task history messages are dropped first (sliding window), init messages and
+   * task instructions are always kept. If that is not enough, the last message is cut.
    */
   public cutMessages(): void {
+    while (
+      this.history.totalTokens > this.settings.maxInputTokens &&
+      this.history.removeOldestHistoryMessage(['init', 'task'])
+    ) {
+      logger.debug(
+        `Removed oldest history message - total tokens now: ${this.history.totalTokens}/${this.settings.maxInputTokens}`,
+      );
+    }
+
     let diff = this.history.totalTokens - this.settings.maxInputTokens;
     if (diff <= 0) return;
 
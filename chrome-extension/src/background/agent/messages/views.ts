@@ -1,4 +1,4 @@
-import { type BaseMessage, HumanMessage, SystemMessage } from '@langchain/core/messages';
+import { type BaseMessage, AIMessage, HumanMessage, SystemMessage, ToolMessage } from '@langchain/core/messages';
 
 export class MessageMetadata {
   tokens: number;
@@ -72,6 +72,35 @@ export class MessageHistory {
     return this.totalTokens;
   }
 
+  /**
+   * Remove the oldest message of the task history, keeping messages of the protected types
+   * and the last message (the current state). A tool call is removed together with its tool
+   * responses so the remaining history is still a valid conversation for the model.
+   * @param protectedTypes - Message types that must never be removed
+   * @returns true if a message was removed
+   */
+  removeOldestHistoryMessage(protectedTypes: string[]): boolean {
+    for (let i = 0; i < this.messages.length - 1; i++) {
+      const { message, metadata } = this.messages[i];
+      if (metadata.message_type !== null && protectedTypes.includes(metadata.message_type)) {
+        continue;
+      }
+
+      let count = 1;
+      if (message instanceof AIMessage && message.tool_calls && message.tool_calls.length > 0) {
+        while (i + count < this.messages.length - 1 && this.messages[i + count].message instanceof ToolMessage) {
+          count++;
+        }
+      }
+
+      for (const removed of this.messages.splice(i, count)) {
+        this.totalTokens -= removed.metadata.tokens;
+      }
+      return true;
+    }
+    return false;
+  }
+
   /**
    * Remove oldest non-system message
    */
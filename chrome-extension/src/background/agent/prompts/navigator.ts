@@ -7,16 +7,24 @@ import { navigatorSystemPromptTemplate } from './templates/navigator';
 
 const logger = createLogger('agent/prompts/navigator');
 
+// The template is split around its only placeholder once, formatting is then a plain concatenation
+const promptParts = navigatorSystemPromptTemplate.trim().split('{{max_actions}}');
+if (promptParts.length !== 2) {
+  throw new Error(`Navigator prompt template must contain exactly one {{max_actions}}, found ${promptParts.length - 1}`);
+}
+const [promptHead, promptTail] = promptParts;
+
+function formatSystemPrompt(maxActionsPerStep: number): string {
+  return promptHead + maxActionsPerStep + promptTail;
+}
+
 export class NavigatorPrompt extends BasePrompt {
   private systemMessage: SystemMessage;
 
   constructor(private readonly maxActionsPerStep = 10) {
     super();
 
-    const promptTemplate = navigatorSystemPromptTemplate;
-    // Format the template with the maxActionsPerStep
-    const formattedPrompt = promptTemplate.replace('{{max_actions}}', this.maxActionsPerStep.toString()).trim();
-    this.systemMessage = new SystemMessage(formattedPrompt);
+    this.systemMessage = new SystemMessage(formatSystemPrompt(this.maxActionsPerStep));
   }
 
   getSystemMessage(): SystemMessage {
@@ -5,8 +5,16 @@ import type { AgentContext } from '@src/background/agent/types';
 import { plannerSystemPromptTemplate } from './templates/planner';
 
 export class PlannerPrompt extends BasePrompt {
+  private systemMessage: SystemMessage;
+
+  constructor() {
+    super();
+
+    this.systemMessage = new SystemMessage(plannerSystemPromptTemplate);
+  }
+
   getSystemMessage(): SystemMessage {
-    return new SystemMessage(plannerSystemPromptTemplate);
+    return this.systemMessage;
   }
 
   async getUserMessage(context: AgentContext): Promise<HumanMessage> {
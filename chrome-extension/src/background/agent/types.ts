@@ -4,7 +4,7 @@ import { DEFAULT_INCLUDE_ATTRIBUTES } from '../browser/dom/views';
 import type { DOMHistoryElement } from '../browser/dom/history/view';
 import type MessageManager from './messages/service';
 import type { EventManager } from './event/manager';
-import { type Actors, type ExecutionState, AgentEvent } from './event/types';
+import { type Actors, type ExecutionState, AgentEvent, EventType } from './event/types';
 import { AgentStepHistory } from './history';
 
 export interface AgentOptions {
@@ -63,6 +63,8 @@ export class AgentContext {
     this.messageManager = messageManager;
     this.eventManager = eventManager;
     this.options = { ...DEFAULT_AGENT_OPTIONS, ...options };
+    // the spread above is shallow, copy the array so a task can never mutate the shared default
+    this.options.includeAttributes = [...this.options.includeAttributes];
 
     this.paused = false;
     this.stopped = false;
@@ -76,6 +78,10 @@ export class AgentContext {
   }
 
   async emitEvent(actor: Actors, state: ExecutionState, eventDetails: string) {
+    // nobody listens once the executor is cleaned up (e.g. replaced by a new task), skip building the event
+    if (!this.eventManager.hasSubscribers(EventType.EXECUTION)) {
+      return;
+    }
     const event = new AgentEvent(actor, state, {
       taskId: this.taskId,
       step: this.nSteps,
@@ -56,10 +56,8 @@ export default class BrowserContext {
   public async cleanup(): Promise<void> {
     const currentPage = await this.getCurrentPage();
     currentPage?.removeHighlight();
-    // detach all pages
-    for (const page of this._attachedPages.values()) {
-      await page.detachPuppeteer();
-    }
+    // detach all pages, each one owns an independent debugger connection
+    await Promise.all(Array.from(this._attachedPages.values(), page => page.detachPuppeteer()));
     this._attachedPages.clear();
     this._currentTabId = null;
   }
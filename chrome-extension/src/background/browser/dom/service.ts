@@ -173,24 +173,28 @@ async function _buildDomTree(
 
     // Get sub-frames info, so that we can run the buildDomTree only on the frames that failed,
     // to avoid double parsing & highlighting on the frames that succeeded.
-    const frameInfoResultsRaw = await Promise.all(
-      subFrames.map(async frame => {
-        const result = await chrome.scripting.executeScript({
-          target: { tabId, frameIds: [frame.frameId] },
-          func: frameId => ({
-            frameId,
+    // One injection across all sub-frames instead of a round trip per frame.
+    const frameInfoResultsRaw = subFrames.length
+      ? await chrome.scripting.executeScript({
+          target: { tabId, frameIds: subFrames.map(frame => frame.frameId) },
+          func: () => ({
             computedHeight: window.innerHeight,
             computedWidth: window.innerWidth,
             href: window.location.href,
             name: window.name,
             title: document.title,
           }),
-          args: [frame.frameId],
-        });
-        return result[0].result;
-      }),
+        })
+      : [];
+    // Injection results are not guaranteed to follow the frameIds order. Restore the subFrames order,
+    // constructFrameTree assigns highlight indices in array order and they must be stable between builds.
+    const frameInfoByFrameId = new Map(
+      frameInfoResultsRaw.map(injection => [
+        injection.frameId,
+        injection.result ? { ...injection.result, frameId: injection.frameId } : null,
+      ]),
     );
-    const frameInfoResults = frameInfoResultsRaw.filter(isNotNull);
+    const frameInfoResults = subFrames.map(frame => frameInfoByFrameId.get(frame.frameId)).filter(isNotNull);
 
     const frameTreeResult = await constructFrameTree(
       tabId,
@@ -19,6 +19,45 @@ export const DEFAULT_INCLUDE_ATTRIBUTES = [
   'href',
 ];
 
+// Pattern for class names that can be used as-is in a CSS selector
+const VALID_CLASS_NAME_PATTERN = /^[a-zA-Z_][a-zA-Z0-9_-]*$/;
+
+// Attributes that are stable and useful for selection
+const SAFE_SELECTOR_ATTRIBUTES = new Set([
+  // Data attributes (if they're stable in your application)
+  'id',
+  // Standard HTML attributes
+  'name',
+  'type',
+  'placeholder',
+  // Accessibility attributes
+  'aria-label',
+  'aria-labelledby',
+  'aria-describedby',
+  'role',
+  // Common form attributes
+  'for',
+  'autocomplete',
+  'required',
+  'readonly',
+  // Media attributes
+  'alt',
+  'title',
+  'src',
+  // Custom stable attributes
+  'href',
+  'target',
+]);
+
+// Test attributes that are only used when dynamic attributes are included
+const SAFE_SELECTOR_ATTRIBUTES_WITH_DYNAMIC = new Set([
+  ...SAFE_SELECTOR_ATTRIBUTES,
+  'data-id',
+  'data-qa',
+  'data-cy',
+  'data-testid',
+]);
+
 export abstract class DOMBaseNode {
   isVisible: boolean;
   parent: DOMElementNode | null;
@@ -127,6 +166,9 @@ export class DOMElementNode extends DOMBaseNode {
   private _hashedValue?: HashedDomElement;
   private _hashPromise?: Promise<HashedDomElement>;
 
+  // Cache for the enhanced css selectors, keyed by includeDynamicAttributes
+  private _cssSelectorCache?: Map<boolean, string>;
+
   /**
    * Returns a hashed representation of this DOM element
    * Async equivalent of the Python @cached_property hash method
@@ -447,6 +489,19 @@ export class DOMElementNode extends DOMBaseNode {
   }
 
   enhancedCssSelectorForElement(includeDynamicAttributes = true): string {
+    // The node is a snapshot of the page, its xpath and attributes never change once built
+    let cssSelector = this._cssSelectorCache?.get(includeDynamicAttributes);
+    if (cssSelector === undefined) {
+      cssSelector = this._buildEnhancedCssSelector(includeDynamicAttributes);
+      if (!this._cssSelectorCache) {
+        this._cssSelectorCache = new Map();
+      }
+      this._cssSelectorCache.set(includeDynamicAttributes, cssSelector);
+    }
+    return cssSelector;
+  }
+
+  private _buildEnhancedCssSelector(includeDynamicAttributes: boolean): string {
     try {
       if (!this.xpath) {
         return '';
@@ -458,9 +513,6 @@ export class DOMElementNode extends DOMBaseNode {
       // Handle class attributes
       const classValue = this.attributes.class;
       if (classValue && includeDynamicAttributes) {
-        // Define a regex pattern for valid class names in CSS
-        const validClassNamePattern = /^[a-zA-Z_][a-zA-Z0-9_-]*$/;
-
         // Iterate through the class attribute values
         const classes = classValue.trim().split(/\s+/);
         for (const className of classes) {
@@ -470,47 +522,16 @@ export class DOMElementNode extends DOMBaseNode {
           }
 
           // Check if the class name is valid
-          if (validClassNamePattern.test(className)) {
+          if (VALID_CLASS_NAME_PATTERN.test(className)) {
             // Append the valid class name to the CSS selector
             cssSelector += `.${className}`;
           }
         }
       }
 
-      // Expanded set of safe attributes that are stable and useful for selection
-      const SAFE_ATTRIBUTES = new Set([
-        // Data attributes (if they're stable in your application)
-        'id',
-        // Standard HTML attributes
-        'name',
-        'type',
-        'placeholder',
-        // Accessibility attributes
-        'aria-label',
-        'aria-labelledby',
-        'aria-describedby',
-        'role',
-        // Common form attributes
-        'for',
-        'autocomplete',
-        'required',
-        'readonly',
-        // Media attributes
-        'alt',
-        'title',
-        'src',
-        // Custom stable attributes
-        'href',
-        'target',
-      ]);
-
-      // Handle other attributes
-      if (includeDynamicAttributes) {
-        SAFE_ATTRIBUTES.add('data-id');
-        SAFE_ATTRIBUTES.add('data-qa');
-        SAFE_ATTRIBUTES.add('data-cy');
-        SAFE_ATTRIBUTES.add('data-testid');
-      }
+      const safeAttributes = includeDynamicAttributes
+        ? SAFE_SELECTOR_ATTRIBUTES_WITH_DYNAMIC
+        : SAFE_SELECTOR_ATTRIBUTES;
 
       // Handle other attributes
       for (const [attribute, value] of Object.entries(this.attributes)) {
@@ -523,7 +544,7 @@ export class DOMElementNode extends DOMBaseNode {
           continue;
         }
 
-        if (!SAFE_ATTRIBUTES.has(attribute)) {
+        if (!safeAttributes.has(attribute)) {
           continue;
         }
 
@@ -24,6 +24,120 @@ import { isUrlAllowed } from './util';
 
 const logger = createLogger('Page');
 
+// The user agent never changes for the lifetime of the service worker
+const IS_MAC = navigator.userAgent.toLowerCase().includes('mac os x');
+
+const KEY_MAP: { [key: string]: string } = {
+  // Letters
+  a: 'KeyA',
+  b: 'KeyB',
+  c: 'KeyC',
+  d: 'KeyD',
+  e: 'KeyE',
+  f: 'KeyF',
+  g: 'KeyG',
+  h: 'KeyH',
+  i: 'KeyI',
+  j: 'KeyJ',
+  k: 'KeyK',
+  l: 'KeyL',
+  m: 'KeyM',
+  n: 'KeyN',
+  o: 'KeyO',
+  p: 'KeyP',
+  q: 'KeyQ',
+  r: 'KeyR',
+  s: 'KeyS',
+  t: 'KeyT',
+  u: 'KeyU',
+  v: 'KeyV',
+  w: 'KeyW',
+  x: 'KeyX',
+  y: 'KeyY',
+  z: 'KeyZ',
+
+  // Numbers
+  '0': 'Digit0',
+  '1': 'Digit1',
+  '2': 'Digit2',
+  '3': 'Digit3',
+  '4': 'Digit4',
+  '5': 'Digit5',
+  '6': 'Digit6',
+  '7': 'Digit7',
+  '8': 'Digit8',
+  '9': 'Digit9',
+
+  // Special keys
+  control: 'Control',
+  shift: 'Shift',
+  alt: 'Alt',
+  meta: 'Meta',
+  enter: 'Enter',
+  backspace: 'Backspace',
+  delete: 'Delete',
+  arrowleft: 'ArrowLeft',
+  arrowright: 'ArrowRight',
+  arrowup: 'ArrowUp',
+  arrowdown: 'ArrowDown',
+  escape: 'Escape',
+  tab: 'Tab',
+  space: 'Space',
+};
+
+// Request filters used by _waitForStableNetwork
+const RELEVANT_RESOURCE_TYPES = new Set(['document', 'stylesheet', 'image', 'font', 'script', 'iframe']);
+
+const RELEVANT_CONTENT_TYPES = [
+  'text/html',
+  'text/css',
+  'application/javascript',
+  'image/',
+  'font/',
+  'application/json',
+];
+
+const IGNORED_URL_PATTERNS = [
+  // Analytics and tracking
+  'analytics',
+  'tracking',
+  'telemetry',
+  'beacon',
+  'metrics',
+  // Ad-related
+  'doubleclick',
+  'adsystem',
+  'adserver',
+  'advertising',
+  // Social media widgets
+  'facebook.com/plugins',
+  'platform.twitter',
+  'linkedin.com/embed',
+  // Live chat and support
+  'livechat',
+  'zendesk',
+  'intercom',
+  'crisp.chat',
+  'hotjar',
+  // Push notifications
+  'push-notifications',
+  'onesignal',
+  'pushwoosh',
+  // Background sync/heartbeat
+  'heartbeat',
+  'ping',
+  'alive',
+  // WebRTC and streaming
+  'webrtc',
+  'rtmp://',
+  'wss://',
+  // Common CDNs
+  'cloudfront.net',
+  'fastly.net',
+];
+
+const STREAMING_CONTENT_TYPES = ['streaming', 'video', 'audio', 'webm', 'mp4', 'event-stream', 'websocket', 'protobuf'];
+
 export function build_initial_state(tabId?: number, url?: string, title?: string): PageState {
   return {
     elementTree: new DOMElementNode({
@@ -417,15 +531,18 @@ export default class Page {
         logger.debug('content.elementTree: not found');
       }
 
-      // Take screenshot if needed
-      const screenshot = useVision ? await this.takeScreenshot() : null;
-      const [scrollY, visualViewportHeight, scrollHeight] = await this.getScrollInfo();
+      // screenshot (if needed), scroll info and title are independent reads, fetch them in parallel
+      const [screenshot, [scrollY, visualViewportHeight, scrollHeight], title] = await Promise.all([
+        useVision ? this.takeScreenshot() : null,
+        this.getScrollInfo(),
+        this._puppeteerPage?.title(),
+      ]);
 
       // update the state
       this._state.elementTree = content.elementTree;
       this._state.selectorMap = content.selectorMap;
       this._state.url = this._puppeteerPage?.url() || '';
-      this._state.title = (await this._puppeteerPage?.title()) || '';
+      this._state.title = title || '';
       this._state.screenshot = screenshot;
       this._state.scrollY = scrollY;
       this._state.visualViewportHeight = visualViewportHeight;
@@ -466,6 +583,7 @@ export default class Page {
         encoding: 'base64',
         type: 'jpeg',
         quality: 80, // Good balance between quality and file size
+        optimizeForSpeed: true, // favor encoder speed, the image is only sent to the model
       });
 
       // Clean up the style element
@@ -509,7 +627,12 @@ export default class Page {
     }
 
     try {
-      await Promise.all([this.waitForPageAndFramesLoad(), this._puppeteerPage.goto(url)]);
+      // puppeteer only waits for DOMContentLoaded, waitForPageAndFramesLoad covers the remaining network activity
+      // with its own bounded timeouts instead of blocking on the load event of slow subresources
+      await Promise.all([
+        this.waitForPageAndFramesLoad(),
+        this._puppeteerPage.goto(url, { waitUntil: 'domcontentloaded' }),
+      ]);
       logger.info('navigateTo complete');
     } catch (error) {
       if (error instanceof URLNotAllowedError) {
@@ -530,7 +653,10 @@ export default class Page {
     if (!this._puppeteerPage) return;
 
     try {
-      await Promise.all([this.waitForPageAndFramesLoad(), this._puppeteerPage.reload()]);
+      await Promise.all([
+        this.waitForPageAndFramesLoad(),
+        this._puppeteerPage.reload({ waitUntil: 'domcontentloaded' }),
+      ]);
       logger.info('Page refresh complete');
     } catch (error) {
       if (error instanceof URLNotAllowedError) {
@@ -551,7 +677,10 @@ export default class Page {
     if (!this._puppeteerPage) return;
 
     try {
-      await Promise.all([this.waitForPageAndFramesLoad(), this._puppeteerPage.goBack()]);
+      await Promise.all([
+        this.waitForPageAndFramesLoad(),
+        this._puppeteerPage.goBack({ waitUntil: 'domcontentloaded' }),
+      ]);
       logger.info('Navigation back completed');
     } catch (error) {
       if (error instanceof URLNotAllowedError) {
@@ -572,7 +701,10 @@ export default class Page {
     if (!this._puppeteerPage) return;
 
     try {
-      await Promise.all([this.waitForPageAndFramesLoad(), this._puppeteerPage.goForward()]);
+      await Promise.all([
+        this.waitForPageAndFramesLoad(),
+        this._puppeteerPage.goForward({ waitUntil: 'domcontentloaded' }),
+      ]);
       logger.info('Navigation forward completed');
     } catch (error) {
       if (error instanceof URLNotAllowedError) {
@@ -733,9 +865,10 @@ export default class Page {
     // Press modifiers and main key, ensure modifiers are released even if an error occurs.
     try {
       // Press all modifier keys (e.g., Control, Shift, etc.)
-      for (const modifier of modifiers) {
-        await this._puppeteerPage.keyboard.down(this._convertKey(modifier));
-      }
+      // keyboard.down() updates the modifier state synchronously and the CDP session delivers the events in order,
+      // so the key downs are pipelined instead of waiting for a round trip per modifier
+      const keyboard = this._puppeteerPage.keyboard;
+      await Promise.all(modifiers.map(modifier => keyboard.down(this._convertKey(modifier))));
       // Press the main key
       // also wait for stable state
       await Promise.all([
@@ -748,21 +881,23 @@ export default class Page {
       throw new Error(`Failed to send keys: ${error instanceof Error ? error.message : String(error)}`);
     } finally {
       // Release all modifier keys in reverse order regardless of any errors in key press.
-      for (const modifier of [...modifiers].reverse()) {
-        try {
-          await this._puppeteerPage.keyboard.up(this._convertKey(modifier));
-        } catch (releaseError) {
-          logger.error('Failed to release modifier:', modifier, releaseError);
+      const releasedModifiers = [...modifiers].reverse();
+      const keyboard = this._puppeteerPage.keyboard;
+      const releases = await Promise.allSettled(
+        releasedModifiers.map(modifier => keyboard.up(this._convertKey(modifier))),
+      );
+      releases.forEach((release, i) => {
+        if (release.status === 'rejected') {
+          logger.error('Failed to release modifier:', releasedModifiers[i], release.reason);
         }
-      }
+      });
     }
   }
 
   private _convertKey(key: string): KeyInput {
     const lowerKey = key.trim().toLowerCase();
-    const isMac = navigator.userAgent.toLowerCase().includes('mac os x');
 
-    if (isMac) {
+    if (IS_MAC) {
       if (lowerKey === 'control' || lowerKey === 'ctrl') {
         return 'Meta' as KeyInput; // Use Command key on Mac
       }
@@ -774,66 +909,8 @@ export default class Page {
       }
     }
 
-    const keyMap: { [key: string]: string } = {
-      // Letters
-      a: 'KeyA',
-      b: 'KeyB',
-      c: 'KeyC',
-      d: 'KeyD',
-      e: 'KeyE',
-      f: 'KeyF',
-      g: 'KeyG',
-      h: 'KeyH',
-      i: 'KeyI',
-      j: 'KeyJ',
-      k: 'KeyK',
-      l: 'KeyL',
-      m: 'KeyM',
-      n: 'KeyN',
-      o: 'KeyO',
-      p: 'KeyP',
-      q: 'KeyQ',
-      r: 'KeyR',
-      s: 'KeyS',
-      t: 'KeyT',
-      u: 'KeyU',
-      v: 'KeyV',
-      w: 'KeyW',
-      x: 'KeyX',
-      y: 'KeyY',
-      z: 'KeyZ',
-
-      // Numbers
-      '0': 'Digit0',
-      '1': 'Digit1',
-      '2': 'Digit2',
-      '3': 'Digit3',
-      '4': 'Digit4',
-      '5': 'Digit5',
-      '6': 'Digit6',
-      '7': 'Digit7',
-      '8': 'Digit8',
-      '9': 'Digit9',
-
-      // Special keys
-      control: 'Control',
-      shift: 'Shift',
-      alt: 'Alt',
-      meta: 'Meta',
-      enter: 'Enter',
-      backspace: 'Backspace',
-      delete: 'Delete',
-      arrowleft: 'ArrowLeft',
-      arrowright: 'ArrowRight',
-      arrowup: 'ArrowUp',
-      arrowdown: 'ArrowDown',
-      escape: 'Escape',
-      tab: 'Tab',
-      space: 'Space',
-    };
-
-    const convertedKey = keyMap[lowerKey] || key;
-    logger.info('convertedKey', convertedKey);
+    const convertedKey = KEY_MAP[lowerKey] || key;
+    logger.debug('convertedKey', convertedKey);
     return convertedKey as KeyInput;
   }
 
@@ -861,25 +938,23 @@ export default class Page {
 
           if (elements.length > 0) {
             // Find visible elements and select the nth occurrence
-            const visibleElements = [];
-
-            for (const element of elements) {
-              const isVisible = await element.evaluate(el => {
-                const style = window.getComputedStyle(el);
-                const rect = el.getBoundingClientRect();
-                return (
-                  style.display !== 'none' &&
-                  style.visibility !== 'hidden' &&
-                  style.opacity !== '0' &&
-                  rect.width > 0 &&
-                  rect.height > 0
-                );
-              });
-
-              if (isVisible) {
-                visibleElements.push(element);
-              }
-            }
+            // The checks are independent read-only evaluations, run them concurrently and keep document order
+            const visibility = await Promise.all(
+              elements.map(element =>
+                element.evaluate(el => {
+                  const style = window.getComputedStyle(el);
+                  const rect = el.getBoundingClientRect();
+                  return (
+                    style.display !== 'none' &&
+                    style.visibility !== 'hidden' &&
+                    style.opacity !== '0' &&
+                    rect.width > 0 &&
+                    rect.height > 0
+                  );
+                }),
+              ),
+            );
+            const visibleElements = elements.filter((_, i) => visibility[i]);
 
             // Check if we have enough visible elements for the requested nth occurrence
             if (visibleElements.length >= nth) {
@@ -888,18 +963,14 @@ export default class Page {
               await new Promise(resolve => setTimeout(resolve, 500)); // Wait for scroll to complete
 
               // Dispose of all element handles to prevent memory leaks
-              for (const element of elements) {
-                await element.dispose();
-              }
+              await Promise.all(elements.map(element => element.dispose()));
 
               return true;
             }
           }
 
           // Dispose of all element handles to prevent memory leaks
-          for (const element of elements) {
-            await element.dispose();
-          }
+          await Promise.all(elements.map(element => element.dispose()));
         } catch (e) {
           logger.debug(`Locator attempt failed: ${e}`);
         }
@@ -956,9 +1027,11 @@ export default class Page {
       throw new Error('Element not found or puppeteer is not connected');
     }
 
-    logger.debug(`Attempting to select '${text}' from dropdown`);
-    logger.debug(`Element attributes: ${JSON.stringify(element.attributes)}`);
-    logger.debug(`Element tag: ${element.tagName}`);
+    if (import.meta.env.DEV) {
+      logger.debug(`Attempting to select '${text}' from dropdown`);
+      logger.debug(`Element attributes: ${JSON.stringify(element.attributes)}`);
+      logger.debug(`Element tag: ${element.tagName}`);
+    }
 
     // Validate that we're working with a select element
     if (element.tagName?.toLowerCase() !== 'select') {
@@ -1129,25 +1202,15 @@ export default class Page {
         logger.debug(`Non-critical error preparing element: ${e}`);
       }
 
-      // Get element properties to determine input method
-      const tagName = await element.evaluate(el => el.tagName.toLowerCase());
-      const isContentEditable = await element.evaluate(el => {
-        if (el instanceof HTMLElement) {
-          return el.isContentEditable;
-        }
-        return false;
-      });
-      const isReadOnly = await element.evaluate(el => {
-        if (el instanceof HTMLInputElement || el instanceof HTMLTextAreaElement) {
-          return el.readOnly;
-        }
-        return false;
-      });
-      const isDisabled = await element.evaluate(el => {
-        if (el instanceof HTMLInputElement || el instanceof HTMLTextAreaElement) {
-          return el.disabled;
-        }
-        return false;
+      // Get element properties to determine input method in a single round trip
+      const { tagName, isContentEditable, isReadOnly, isDisabled } = await element.evaluate(el => {
+        const isTextField = el instanceof HTMLInputElement || el instanceof HTMLTextAreaElement;
+        return {
+          tagName: el.tagName.toLowerCase(),
+          isContentEditable: el instanceof HTMLElement ? el.isContentEditable : false,
+          isReadOnly: isTextField ? el.readOnly : false,
+          isDisabled: isTextField ? el.disabled : false,
+        };
       });
 
       // Choose appropriate input method based on element properties
@@ -1165,8 +1228,15 @@ export default class Page {
           el.dispatchEvent(new Event('change', { bubbles: true }));
         });
 
-        // Type the text with a small delay between keypresses
-        await element.type(text, { delay: 50 });
+        if (!this._config.simulateHumanTyping && tagName === 'input' && !isContentEditable && !text.includes('\n')) {
+          // Opt-in fast path: insert the whole text in one Input.insertText call, which fires a native
+          // input event but no key events
+          await element.focus();
+          await this._puppeteerPage.keyboard.sendCharacter(text);
+        } else {
+          // Type the text with a small delay between keypresses
+          await element.type(text, { delay: 50 });
+        }
       } else {
         // Use direct value setting for other types of elements
         await element.evaluate((el, value) => {
@@ -1395,56 +1465,6 @@ export default class Page {
       throw new Error('Puppeteer page is not connected');
     }
 
-    const RELEVANT_RESOURCE_TYPES = new Set(['document', 'stylesheet', 'image', 'font', 'script', 'iframe']);
-
-    const RELEVANT_CONTENT_TYPES = new Set([
-      'text/html',
-      'text/css',
-      'application/javascript',
-      'image/',
-      'font/',
-      'application/json',
-    ]);
-
-    const IGNORED_URL_PATTERNS = new Set([
-      // Analytics and tracking
-      'analytics',
-      'tracking',
-      'telemetry',
-      'beacon',
-      'metrics',
-      // Ad-related
-      'doubleclick',
-      'adsystem',
-      'adserver',
-      'advertising',
-      // Social media widgets
-      'facebook.com/plugins',
-      'platform.twitter',
-      'linkedin.com/embed',
-      // Live chat and support
-      'livechat',
-      'zendesk',
-      'intercom',
-      'crisp.chat',
-      'hotjar',
-      // Push notifications
-      'push-notifications',
-      'onesignal',
-      'pushwoosh',
-      // Background sync/heartbeat
-      'heartbeat',
-      'ping',
-      'alive',
-      // WebRTC and streaming
-      'webrtc',
-      'rtmp://',
-      'wss://',
-      // Common CDNs
-      'cloudfront.net',
-      'fastly.net',
-    ]);
-
     const pendingRequests = new Set();
     let lastActivity = Date.now();
 
@@ -1462,7 +1482,7 @@ export default class Page {
 
       // Filter out by URL patterns
       const url = request.url().toLowerCase();
-      if (Array.from(IGNORED_URL_PATTERNS).some(pattern => url.includes(pattern))) {
+      if (IGNORED_URL_PATTERNS.some(pattern => url.includes(pattern))) {
         return;
       }
 
@@ -1496,17 +1516,13 @@ export default class Page {
       const contentType = response.headers()['content-type']?.toLowerCase() || '';
 
       // Skip streaming content
-      if (
-        ['streaming', 'video', 'audio', 'webm', 'mp4', 'event-stream', 'websocket', 'protobuf'].some(t =>
-          contentType.includes(t),
-        )
-      ) {
+      if (STREAMING_CONTENT_TYPES.some(t => contentType.includes(t))) {
         pendingRequests.delete(request);
         return;
       }
 
       // Only process relevant content types
-      if (!Array.from(RELEVANT_CONTENT_TYPES).some(ct => contentType.includes(ct))) {
+      if (!RELEVANT_CONTENT_TYPES.some(ct => contentType.includes(ct))) {
         pendingRequests.delete(request);
         return;
       }
@@ -1543,10 +1559,12 @@ export default class Page {
 
         const elapsedTime = (now - startTime) / 1000; // Convert to seconds
         if (elapsedTime > this._config.maximumWaitPageLoadTime) {
-          console.debug(
-            `Network timeout after ${this._config.maximumWaitPageLoadTime}s with ${pendingRequests.size} pending requests:`,
-            Array.from(pendingRequests).map(r => (r as HTTPRequest).url()),
-          );
+          if (import.meta.env.DEV) {
+            logger.debug(
+              `Network timeout after ${this._config.maximumWaitPageLoadTime}s with ${pendingRequests.size} pending requests:`,
+              Array.from(pendingRequests).map(r => (r as HTTPRequest).url()),
+            );
+          }
           break;
         }
       }
@@ -1555,7 +1573,7 @@ export default class Page {
       this._puppeteerPage.off('request', onRequest);
       this._puppeteerPage.off('response', onResponse);
     }
-    console.debug(`Network stabilized for ${this._config.waitForNetworkIdlePageLoadTime} seconds`);
+    logger.debug('Network stabilized for', this._config.waitForNetworkIdlePageLoadTime, 'seconds');
   }
 
   async waitForPageAndFramesLoad(timeoutOverwrite?: number): Promise<void> {
@@ -1582,9 +1600,11 @@ export default class Page {
     const minWaitTime = timeoutOverwrite || this._config.minimumWaitPageLoadTime;
     const remaining = Math.max(minWaitTime - elapsed, 0);
 
-    console.debug(
-      `--Page loaded in ${elapsed.toFixed(2)} seconds, waiting for additional ${remaining.toFixed(2)} seconds`,
-    );
+    if (import.meta.env.DEV) {
+      logger.debug(
+        `--Page loaded in ${elapsed.toFixed(2)} seconds, waiting for additional ${remaining.toFixed(2)} seconds`,
+      );
+    }
 
     // Sleep remaining time if needed
     if (remaining > 0) {
@@ -1,3 +1,18 @@
+// URL prefixes that are always blocked, built once instead of on every check
+const DANGEROUS_PREFIXES = [
+  'https://chromewebstore.google.com', // scripts are not allowed to be injected into chrome web store
+  'chrome-extension://',
+  'chrome://',
+  'javascript:',
+  'data:',
+  'file:',
+  'vbscript:',
+  'ws:',
+  'wss:',
+];
+
+const HTTP_PROTOCOL_PATTERN = /^https?:\/\//;
+
 /**
  * Checks if a URL is allowed based on firewall configuration
  * @param url The URL to check
@@ -15,18 +30,6 @@ export function isUrlAllowed(url: string, allowList: string[], denyList: string[
   const lowerCaseUrl = trimmedUrl.toLowerCase();
 
   // ALWAYS block dangerous/forbidden URLs, even if firewall is disabled
-  const DANGEROUS_PREFIXES = [
-    'https://chromewebstore.google.com', // scripts are not allowed to be injected into chrome web store
-    'chrome-extension://',
-    'chrome://',
-    'javascript:',
-    'data:',
-    'file:',
-    'vbscript:',
-    'ws:',
-    'wss:',
-  ];
-
   if (DANGEROUS_PREFIXES.some(prefix => lowerCaseUrl.startsWith(prefix))) {
     return false;
   }
@@ -45,7 +48,7 @@ export function isUrlAllowed(url: string, allowList: string[], denyList: string[
     const parsedUrl = new URL(trimmedUrl);
 
     // 1. Remove protocol prefix for further comparisons
-    const urlWithoutProtocol = lowerCaseUrl.replace(/^https?:\/\//, '');
+    const urlWithoutProtocol = lowerCaseUrl.replace(HTTP_PROTOCOL_PATTERN, '');
 
     // 2. First check full URL against deny list
     for (const deniedEntry of denyList) {
@@ -76,6 +76,13 @@ export interface BrowserContextConfig {
    * @default true
    */
   displayHighlights: boolean;
+
+  /**
+   * Type text into inputs key by key so sites listening to key events react as they would to a user.
+   * If set to false, plain single-line inputs get the whole text in one insertText call instead.
+   * @default true
+   */
+  simulateHumanTyping: boolean;
 }
 
 export const DEFAULT_BROWSER_CONTEXT_CONFIG: BrowserContextConfig = {
@@ -90,6 +97,7 @@ export const DEFAULT_BROWSER_CONTEXT_CONFIG: BrowserContextConfig = {
   includeDynamicAttributes: true,
   homePageUrl: 'about:blank',
   displayHighlights: true,
+  simulateHumanTyping: true,
 };
 
 export interface PageState extends DOMState {
@@ -25,6 +25,8 @@ const browserContext = new BrowserContext({});
 let currentExecutor: Executor | null = null;
 let currentPort: chrome.runtime.Port | null = null;
 const SIDE_PANEL_URL = chrome.runtime.getURL('side-panel/index.html');
+// Heartbeat replies carry no payload, reuse a single message object
+const HEARTBEAT_ACK = { type: 'heartbeat_ack' } as const;
 
 // Setup side panel behavior
 chrome.sidePanel.setPanelBehavior({ openPanelOnActionClick: true }).catch(error => console.error(error));
@@ -89,12 +91,13 @@ chrome.runtime.onConnect.addListener(port => {
 
     port.onMessage.addListener(async message => {
       try {
-        switch (message.type) {
-          case 'heartbeat':
-            // Acknowledge heartbeat
-            port.postMessage({ type: 'heartbeat_ack' });
-            break;
+        // Heartbeats are the most frequent message, acknowledge them before the command dispatch
+        if (message.type === 'heartbeat') {
+          port.postMessage(HEARTBEAT_ACK);
+          return;
+        }
 
+        switch (message.type) {
           case 'new_task': {
             if (!message.task) return port.postMessage({ type: 'error', error: t('bg_cmd_newTask_noTask') });
             if (!message.tabId) return port.postMessage({ type: 'error', error: t('bg_errors_noTabId') });
@@ -266,16 +269,20 @@ chrome.runtime.onConnect.addListener(port => {
 });
 
 async function setupExecutor(taskId: string, task: string, browserContext: BrowserContext) {
-  const providers = await llmProviderStore.getAllProviders();
+  // The settings live in separate storage areas, load them concurrently.
+  // Legacy validator settings are cleaned up before the agent models are read.
+  const [providers, agentModels, firewall, generalSettings] = await Promise.all([
+    llmProviderStore.getAllProviders(),
+    agentModelStore.cleanupLegacyValidatorSettings().then(() => agentModelStore.getAllAgentModels()),
+    firewallStore.getFirewall(),
+    generalSettingsStore.getSettings(),
+  ]);
+
   // if no providers, need to display the options page
   if (Object.keys(providers).length === 0) {
     throw new Error(t('bg_setup_noApiKeys'));
   }
 
-  // Clean up any legacy validator settings for backward compatibility
-  await agentModelStore.cleanupLegacyValidatorSettings();
-
-  const agentModels = await agentModelStore.getAllAgentModels();
   // verify if every provider used in the agent models exists in the providers
   for (const agentModel of Object.values(agentModels)) {
     if (!providers[agentModel.provider]) {
@@ -300,7 +307,6 @@ async function setupExecutor(taskId: string, task: string, browserContext: Brows
   }
 
   // Apply firewall settings to browser context
-  const firewall = await firewallStore.getFirewall();
   if (firewall.enabled) {
     browserContext.updateConfig({
       allowedUrls: firewall.allowList,
@@ -313,7 +319,6 @@ async function setupExecutor(taskId: string, task: string, browserContext: Brows
     });
   }
 
-  const generalSettings = await generalSettingsStore.getSettings();
   browserContext.updateConfig({
     minimumWaitPageLoadTime: generalSettings.minWaitPageLoad / 1000.0,
     displayHighlights: generalSettings.displayHighlights,
@@ -13,6 +13,7 @@ interface TaskMetrics {
 
 export class AnalyticsService {
   private initialized = false;
+  private initPromise: Promise<void> | null = null;
   private enabled = false;
   private taskMetrics = new Map<string, TaskMetrics>();
 
@@ -51,6 +52,16 @@ export class AnalyticsService {
   ];
 
   async init(): Promise<void> {
+    // init is reachable from startup and from the settings subscription, share a single in-flight run
+    if (!this.initPromise) {
+      this.initPromise = this._init().finally(() => {
+        this.initPromise = null;
+      });
+    }
+    return this.initPromise;
+  }
+
+  private async _init(): Promise<void> {
     try {
       const settings = await analyticsSettingsStore.getSettings();
       this.enabled = settings.enabled;
@@ -252,8 +263,14 @@ export class AnalyticsService {
       this.enabled = settings.enabled;
 
       if (!wasEnabled && this.enabled) {
-        // Re-initialize if analytics was disabled and now enabled
-        await this.init();
+        if (this.initialized) {
+          // PostHog is already set up, calling init again would be a no-op, just resume capturing
+          posthog.opt_in_capturing();
+          logger.info('Analytics opted in');
+        } else {
+          // Initialize if analytics was disabled and now enabled
+          await this.init();
+        }
       } else if (wasEnabled && !this.enabled) {
         // Opt out if analytics was enabled and now disabled
         if (this.initialized) {
@@ -1,5 +1,6 @@
 import { createStorage } from '../base/base';
 import { StorageEnum } from '../base/enums';
+import type { BaseStorage } from '../base/types';
 import type {
   ChatSession,
   ChatMessage,
@@ -21,12 +22,22 @@ const chatSessionsMetaStorage = createStorage<ChatSessionMetadata[]>(CHAT_SESSIO
 // Helper function to get storage key for a specific session's messages
 const getSessionMessagesKey = (sessionId: string) => `chat_messages_${sessionId}`;
 
-// Helper function to create storage for a specific session's messages
+// Per-session storages are memoized: each createStorage call issues an initial read
+// and registers its own onChanged listener, which would otherwise pile up per operation
+const sessionMessagesStorages = new Map<string, BaseStorage<ChatMessage[]>>();
+const sessionAgentStepHistoryStorages = new Map<string, BaseStorage<ChatAgentStepHistory>>();
+
+// Helper function to get storage for a specific session's messages
 const getSessionMessagesStorage = (sessionId: string) => {
-  return createStorage<ChatMessage[]>(getSessionMessagesKey(sessionId), [], {
-    storageEnum: StorageEnum.Local,
-    liveUpdate: true,
-  });
+  let storage = sessionMessagesStorages.get(sessionId);
+  if (!storage) {
+    storage = createStorage<ChatMessage[]>(getSessionMessagesKey(sessionId), [], {
+      storageEnum: StorageEnum.Local,
+      liveUpdate: true,
+    });
+    sessionMessagesStorages.set(sessionId, storage);
+  }
+  return storage;
 };
 
 // Helper function to get storage key for a specific session's agent state history
@@ -34,18 +45,37 @@ const getSessionAgentStepHistoryKey = (sessionId: string) => `chat_agent_step_${
 
 // Helper function to get storage for a specific session's agent state history
 const getSessionAgentStepHistoryStorage = (sessionId: string) => {
-  return createStorage<ChatAgentStepHistory>(
-    getSessionAgentStepHistoryKey(sessionId),
-    {
-      task: '',
-      history: '',
-      timestamp: 0,
-    },
-    {
-      storageEnum: StorageEnum.Local,
-      liveUpdate: true,
-    },
-  );
+  let storage = sessionAgentStepHistoryStorages.get(sessionId);
+  if (!storage) {
+    storage = createStorage<ChatAgentStepHistory>(
+      getSessionAgentStepHistoryKey(sessionId),
+      {
+        task: '',
+        history: '',
+        timestamp: 0,
+      },
+      {
+        storageEnum: StorageEnum.Local,
+        liveUpdate: true,
+      },
+    );
+    sessionAgentStepHistoryStorages.set(sessionId, storage);
+  }
+  return storage;
+};
+
+// Helper function to empty a session's messages and forget its cached storages.
+// Uses the cached storage when there is one, otherwise writes the key directly instead of
+// creating (and caching) a storage just to clear it
+const clearSessionMessages = async (sessionId: string) => {
+  const messagesStorage = sessionMessagesStorages.get(sessionId);
+  if (messagesStorage) {
+    await messagesStorage.set([]);
+  } else {
+    await chrome.storage[StorageEnum.Local].set({ [getSessionMessagesKey(sessionId)]: [] });
+  }
+  sessionMessagesStorages.delete(sessionId);
+  sessionAgentStepHistoryStorages.delete(sessionId);
 };
 
 // Helper function to get current timestamp in milliseconds
@@ -70,8 +100,7 @@ export function createChatHistoryStorage(): ChatHistoryStorage {
     clearAllSessions: async (): Promise<void> => {
       const sessionsMeta = await chatSessionsMetaStorage.get();
       for (const sessionMeta of sessionsMeta) {
-        const messagesStorage = getSessionMessagesStorage(sessionMeta.id);
-        await messagesStorage.set([]);
+        await clearSessionMessages(sessionMeta.id);
       }
       await chatSessionsMetaStorage.set([]);
     },
@@ -158,8 +187,7 @@ export function createChatHistoryStorage(): ChatHistoryStorage {
       await chatSessionsMetaStorage.set(prevSessions => prevSessions.filter(session => session.id !== sessionId));
 
       // Remove the session's messages
-      const messagesStorage = getSessionMessagesStorage(sessionId);
-      await messagesStorage.set([]);
+      await clearSessionMessages(sessionId);
     },
 
     addMessage: async (sessionId: string, message: Message): Promise<ChatMessage> => {
@@ -201,11 +229,9 @@ export function createChatHistoryStorage(): ChatHistoryStorage {
       // Get the messages storage for this session
       const messagesStorage = getSessionMessagesStorage(sessionId);
 
-      // Get current messages to calculate the new count
-      const currentMessages = await messagesStorage.get();
-      const messageToDelete = currentMessages.find(msg => msg.id === messageId);
-
-      if (!messageToDelete) return; // Message not found
+      // Check the message exists before writing, the cached snapshot avoids a storage read when available
+      const currentMessages = messagesStorage.getSnapshot() ?? (await messagesStorage.get());
+      if (!currentMessages.some(msg => msg.id === messageId)) return; // Message not found
 
       // Remove the message directly from the messages storage
       await messagesStorage.set(prevMessages => prevMessages.filter(msg => msg.id !== messageId));
@@ -80,6 +80,11 @@ function MessageBlock({ message, isSameActor, isDarkMode = false }: MessageBlock
   );
 }
 
+// Formatters are reused across renders instead of being rebuilt by toLocale*String for every message
+const TIME_FORMAT = new Intl.DateTimeFormat([], { hour: '2-digit', minute: '2-digit' });
+const MONTH_DAY_FORMAT = new Intl.DateTimeFormat([], { month: 'short', day: 'numeric' });
+const FULL_DATE_FORMAT = new Intl.DateTimeFormat([], { year: 'numeric', month: 'short', day: 'numeric' });
+
 /**
  * Formats a timestamp (in milliseconds) to a readable time string
  * @param timestamp Unix timestamp in milliseconds
@@ -101,7 +106,7 @@ function formatTimestamp(timestamp: number): string {
   const isThisYear = date.getFullYear() === now.getFullYear();
 
   // Format the time (HH:MM)
-  const timeStr = date.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
+  const timeStr = TIME_FORMAT.format(date);
 
   if (isToday) {
     return timeStr; // Just show the time for today's messages
@@ -113,9 +118,9 @@ function formatTimestamp(timestamp: number): string {
 
   if (isThisYear) {
     // Show month and day for this year
-    return `${date.toLocaleDateString([], { month: 'short', day: 'numeric' })}, ${timeStr}`;
+    return `${MONTH_DAY_FORMAT.format(date)}, ${timeStr}`;
   }
 
   // Show full date for older messages
-  return `${date.toLocaleDateString([], { year: 'numeric', month: 'short', day: 'numeric' })}, ${timeStr}`;
+  return `${FULL_DATE_FORMAT.format(date)}, ${timeStr}`;
 }